@@ -1,10 +1,14 @@
+from typing import Optional
+
 from aioabcpapi import BaseAbcp
+from aioabcpapi.api import RetryPolicy
 from aioabcpapi.cp.base import CpApi
 from aioabcpapi.ts.base import TsApi
 
 
 class Abcp:
-    def __init__(self, host: str, login: str, password: str):
+    def __init__(self, host: str, login: str, password: str, retry_policy: Optional[RetryPolicy] = None,
+                 payment_token_ttl: Optional[float] = None):
         """
         Инициализация класса API
 
@@ -19,8 +23,11 @@ class Abcp:
         :param host: Хост
         :param login: Логин
         :param password: MD5-пароль
+        :param retry_policy: Повтор запросов при временных ошибках, по умолчанию запросы не повторяются
+        :param payment_token_ttl: Время кэширования ссылок на оплату в секундах, по умолчанию не кэшируются
         """
-        self._base = BaseAbcp(host, login, password)
+        self._base = BaseAbcp(host, login, password, retry_policy=retry_policy,
+                              payment_token_ttl=payment_token_ttl)
         self.cp = CpApi(self._base)
         self.ts = TsApi(self._base)
 
@@ -1,16 +1,34 @@
+import asyncio
+import json
 import logging
+import random
 import re
 from dataclasses import dataclass
 from http import HTTPStatus
-from typing import Dict, Union
+from typing import Dict, FrozenSet, Optional, Union
 
 import aiohttp
 
+try:
+    # orjson необязателен: pip install aioabcpapi[orjson]
+    import orjson
+except ImportError:
+    orjson = None
+
 from .exceptions import UnsupportedHost, PasswordType, UnsupportedLogin, NetworkError, \
     AbcpAPIError, TeaPot, AbcpNotFoundError
 
 logger = logging.getLogger('api')
 
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 
 def check_data(host: str, login: str, password: str) -> bool:
     regex_md = re.match(r"([a-f\d]{32})", password)
@@ -60,7 +78,7 @@ def check_result(method_name: str, content_type: str, status_code: int, body):
     elif status_code == HTTPStatus.BAD_REQUEST:
         raise AbcpAPIError(f"{body['errorMessage']} {body['errorCode']} [{status_code}]")
     elif status_code == HTTPStatus.NOT_FOUND:
-        if any(method_name == x for x in SEARCH_METHODS):
+        if method_name in SEARCH_METHODS:
             raise AbcpNotFoundError(f"{body['errorMessage']} {body['errorCode']} [{status_code}]")
         raise AbcpAPIError(f"{body['errorMessage']} {body['errorCode']} [{status_code}]")
     elif status_code == HTTPStatus.CONFLICT:
@@ -75,45 +93,85 @@ def check_result(method_name: str, content_type: str, status_code: int, body):
     raise AbcpAPIError(f"{body} [{status_code}]")
 
 
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Повтор запросов при временных ошибках API
+
+    Задержка перед повтором растет экспоненциально и выбирается случайно от 0 до min(cap, base * 2 ** attempt),
+    чтобы одновременные клиенты не повторяли запросы синхронно.
+    Запросы с файлами (FormData) не повторяются.
+    POST-запрос, на который сервер не успел ответить, может быть выполнен повторно.
+
+    :param attempts: Количество повторов после первой попытки
+    :param base: Базовая задержка в секундах
+    :param cap: Максимальная задержка в секундах
+    :param statuses: HTTP-статусы, при которых запрос повторяется
+    """
+    attempts: int = 3
+    base: float = 1
+    cap: float = 30
+    statuses: FrozenSet[int] = frozenset({408, 429, 502, 503, 504})
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.cap, self.base * 2 ** attempt))
+
+
+def _can_retry(retry_policy: Optional[RetryPolicy], attempt: int, data) -> bool:
+    return retry_policy is not None and attempt < retry_policy.attempts and not isinstance(data, aiohttp.FormData)
+
+
 async def make_request_json(session, host, method,
                             data: Dict, headers,
+                            retry_policy: Optional[RetryPolicy] = None,
                             **kwargs):
     url = f'https://{host}/{method}'
-    try:
-        async with session.post(url, json=data, headers=headers, **kwargs) as response:
-            try:
-                body = await response.json()
-                return check_result(method, response.content_type, response.status, body)
-            except:
-                raise AbcpAPIError(response.text)
-    except aiohttp.ClientError as e:
-        raise NetworkError(f"aiohttp client throws an error: {e.__class__.__name__}: {e}")
+    attempt = 0
+    while True:
+        try:
+            async with session.post(url, json=data, headers=headers, **kwargs) as response:
+                if not (_can_retry(retry_policy, attempt, data) and response.status in retry_policy.statuses):
+                    try:
+                        body = await response.json(loads=json_loads)
+                        return check_result(method, response.content_type, response.status, body)
+                    except:
+                        raise AbcpAPIError(response.text)
+        except aiohttp.ClientError as e:
+            if not _can_retry(retry_policy, attempt, data):
+                raise NetworkError(f"aiohttp client throws an error: {e.__class__.__name__}: {e}")
+        logger.debug('Retry _request: "%s", attempt %d', method, attempt + 1)
+        await asyncio.sleep(retry_policy.delay(attempt))
+        attempt += 1
 
 
 async def make_request(session, host, method,
                        data: Union[Dict, aiohttp.FormData],
                        headers, post,
+                       retry_policy: Optional[RetryPolicy] = None,
                        **kwargs):
     logger.debug('Make _request: "%s" with data: "%r"', method, data)
 
     url = f'https://{host}/{method}'
-    try:
-        if post:
-            async with session.post(url, data=data, headers=headers, **kwargs) as response:
-                try:
-                    body = await response.json()
-                except:
-                    body = response.text
-                return check_result(method, response.content_type, response.status, body)
-        else:
-            async with session.get(url, params=data, **kwargs) as response:
-                try:
-                    body = await response.json()
-                except:
-                    body = response.text
-                return check_result(method, response.content_type, response.status, body)
-    except aiohttp.ClientError as e:
-        raise NetworkError(f"aiohttp client throws an error: {e.__class__.__name__}: {e}")
+    attempt = 0
+    while True:
+        try:
+            if post:
+                context = session.post(url, data=data, headers=headers, **kwargs)
+            else:
+                context = session.get(url, params=data, **kwargs)
+            async with context as response:
+                if not (_can_retry(retry_policy, attempt, data) and response.status in retry_policy.statuses):
+                    try:
+                        body = await response.json(loads=json_loads)
+                    except:
+                        body = response.text
+                    return check_result(method, response.content_type, response.status, body)
+        except aiohttp.ClientError as e:
+            if not _can_retry(retry_policy, attempt, data):
+                raise NetworkError(f"aiohttp client throws an error: {e.__class__.__name__}: {e}")
+        logger.debug('Retry _request: "%s", attempt %d', method, attempt + 1)
+        await asyncio.sleep(retry_policy.delay(attempt))
+        attempt += 1
 
 
 class Headers:
@@ -497,6 +555,7 @@ class _Methods:
         pass
 
 
-SEARCH_METHODS = (_Methods.Client.Search.BRANDS, _Methods.Client.Search.ARTICLES, _Methods.Client.Search.BATCH,
-                  _Methods.Client.Search.HISTORY, _Methods.Client.Search.TIPS, _Methods.Client.Search.ADVICES,
-                  _Methods.Client.Search.ADVICES_BATCH)
+SEARCH_METHODS = frozenset({_Methods.Client.Search.BRANDS, _Methods.Client.Search.ARTICLES,
+                            _Methods.Client.Search.BATCH, _Methods.Client.Search.HISTORY,
+                            _Methods.Client.Search.TIPS, _Methods.Client.Search.ADVICES,
+                            _Methods.Client.Search.ADVICES_BATCH})
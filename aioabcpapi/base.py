@@ -5,10 +5,9 @@ from typing import Dict, List, Optional, Union, Type, Any
 
 import aiohttp
 import certifi
-import ujson
 from aiohttp import FormData
 
-from .api import Headers, _Methods, check_data, make_request_json, make_request
+from .api import Headers, RetryPolicy, _Methods, check_data, json_dumps, make_request_json, make_request
 from .exceptions import NotEnoughRights
 
 logger = logging.getLogger('base')
@@ -24,6 +23,8 @@ class BaseAbcp:
             loop: Optional[Union[asyncio.BaseEventLoop, asyncio.AbstractEventLoop]] = None,
             connections_limit: int = None,
             timeout: Optional[Union[int, float, aiohttp.ClientTimeout]] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            payment_token_ttl: Optional[float] = None,
     ):
         """Для получения доступа к API если вы являетесь администратором, перейдите в ПУ.
 
@@ -34,6 +35,8 @@ class BaseAbcp:
         :param host: Хост
         :param login: Логин
         :param password: MD5-пароль
+        :param retry_policy: Повтор запросов при временных ошибках, по умолчанию запросы не повторяются
+        :param payment_token_ttl: Время кэширования ссылок на оплату в секундах, по умолчанию не кэшируются
         :raise: when host, login or password is invalid
         :return: Объект класса
         """
@@ -58,11 +61,13 @@ class BaseAbcp:
         self._headers = Headers()
 
         self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.payment_token_ttl = payment_token_ttl
 
     async def _get_new_session(self) -> aiohttp.ClientSession:
         return aiohttp.ClientSession(
             connector=self._connector_class(**self._connector_init),
-            json_serialize=ujson.dumps
+            json_serialize=json_dumps
         )
 
     @property
@@ -123,8 +128,10 @@ class BaseAbcp:
             headers = self._headers.multipart_header()
         elif kwargs is not None and 'json' in kwargs.keys():
             headers = self._headers.json_header()
-            return await make_request_json(await self._get_session(), self._host, method, payload, headers)
+            return await make_request_json(await self._get_session(), self._host, method, payload, headers,
+                                           retry_policy=self.retry_policy)
         else:
             headers = self._headers.url_encoded_header()
         return await make_request(await self._get_session(), self._host,
-                                  method, payload, headers, post, timeout=self.timeout, **kwargs)
+                                  method, payload, headers, post, retry_policy=self.retry_policy,
+                                  timeout=self.timeout, **kwargs)
@@ -1,14 +1,19 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
+import copy
+import time
 from datetime import datetime
 from io import BufferedReader
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..api import _Methods
 from ..base import BaseAbcp
 from ..exceptions import AbcpAPIError, AbcpParameterRequired, AbcpWrongParameterError
 from ..utils.payload import generate_payload, generate_payload_filter, generate_payload_payments, \
-    generate_payload_online_order, generate_file_payload
+    generate_payload_online_order, generate_file_payload, close_files
+
+# Максимальное число ссылок на оплату в кэше Payment.token
+_TOKEN_CACHE_SIZE = 1024
 
 
 class AdminApi:
@@ -1451,7 +1456,7 @@ class Distributors:
         """
         if supplier_code_enabled_list is not None and not isinstance(supplier_code_enabled_list, list):
             supplier_code_enabled_list = [supplier_code_enabled_list]
-        if supplier_code_disabled_list is not None and isinstance(supplier_code_disabled_list, list):
+        if supplier_code_disabled_list is not None and not isinstance(supplier_code_disabled_list, list):
             supplier_code_disabled_list = [supplier_code_disabled_list]
         payload = generate_payload(**locals())
 
@@ -1541,8 +1546,11 @@ class Distributors:
         :return: dict
         """
 
-        payload = generate_file_payload(exclude=['upload_file'], **locals())
-        return await self._base.request(_Methods.Admin.Distributors.UPLOAD_PRICE, payload, True)
+        payload, files = generate_file_payload(exclude=['upload_file'], **locals())
+        try:
+            return await self._base.request(_Methods.Admin.Distributors.UPLOAD_PRICE, payload, True)
+        finally:
+            close_files(files)
 
 
 class Catalog:
@@ -1618,18 +1626,25 @@ class UsersCatalog:
         if image_upload_mode == 1 and image_archive is None:
             raise AbcpWrongParameterError('Не передан архив с изображениями')
 
-        payload = generate_file_payload(exclude=['file', 'image_archive', 'catalog_id'], max_size=100, **locals())
-        return await self._base.request(_Methods.Admin.UsersCatalog.UPLOAD.format(catalog_id), payload, True)
+        payload, files = generate_file_payload(exclude=['file', 'image_archive', 'catalog_id'], max_size=100,
+                                               **locals())
+        try:
+            return await self._base.request(_Methods.Admin.UsersCatalog.UPLOAD.format(catalog_id), payload, True)
+        finally:
+            close_files(files)
 
 
 class Payment:
     def __init__(self, base: BaseAbcp):
         self._base = base
+        self._token_cache: Dict[str, Tuple[float, Any]] = {}
 
     async def token(self, number: Union[str, int]):
         """
         Получение ссылки на оплату заказа
 
+        Если в Abcp передан payment_token_ttl, ответ кэшируется на это число секунд для каждого номера заказа
+
         :param number: Онлайн-номер заказа
         :return:
         """
@@ -1637,7 +1652,28 @@ class Payment:
             raise AbcpWrongParameterError('Параметр "number" должен быть числом')
 
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.Admin.Payment.TOKEN, payload)
+        ttl = self._base.payment_token_ttl
+        if not ttl:
+            return await self._base.request(_Methods.Admin.Payment.TOKEN, payload)
+        key = str(number)
+        cached = self._token_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+        result = await self._base.request(_Methods.Admin.Payment.TOKEN, payload)
+        now = time.monotonic()
+        self._token_cache.pop(key, None)
+        if len(self._token_cache) >= _TOKEN_CACHE_SIZE:
+            self._token_cache = {k: v for k, v in self._token_cache.items() if v[0] > now}
+            if len(self._token_cache) >= _TOKEN_CACHE_SIZE:
+                del self._token_cache[next(iter(self._token_cache))]
+        self._token_cache[key] = (now + ttl, result)
+        return copy.deepcopy(result)
+
+    def clear_token_cache(self):
+        """
+        Очистка кэша ссылок на оплату заказов
+        """
+        self._token_cache.clear()
 
     async def top_balance_link(self, client_id: Union[str, int], amount: Union[float, int, str]):
         """
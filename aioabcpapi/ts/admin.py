@@ -1,17 +1,30 @@
-import base64
+import asyncio
 import os
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Union, List, Dict, Optional
 
-import pytz
-from pyrfc3339 import generate
-
 from ..api import _Methods
 from ..base import BaseAbcp
 from ..exceptions import AbcpWrongParameterError, AbcpParameterRequired
-from ..utils.fields_checker import check_fields
-from ..utils.payload import generate_payload
+from ..utils.dates import norm_dt
+from ..utils.fields_checker import check_fields, check_limit
+from ..utils.payload import generate_payload, encode_file_base64
+
+_SR_OPERATIONS_FIELDS = frozenset({"goodsReceipt", "agreement", "tags"})
+_SR_POSITIONS_FIELDS = frozenset({"item", "location", "operationInfo", "tags",
+                                  "goodsReceiptPos", "availableQuantity", "customerComplaintPos"})
+_CC_GET_FIELDS = frozenset({"orderPicking", "agreement", "tags", "posInfo"})
+_CC_GET_POSITIONS_FIELDS = frozenset({"item", "product", "location", "orderPickingInfo", "tags", "operationInfo",
+                                      "supplierReturnPos"})
+_CC_UPDATE_FIELDS = frozenset({"orderPicking", "agreement", "posInfo"})
+_ORDERS_FIELDS = frozenset({"deliveries", "agreement", "tags", "posInfo", "amounts"})
+_POSITIONS_ADDITIONAL_INFO = frozenset({"reserv", "product", "orderPicking",
+                                        "customerComplaintPoses", "supplierOrder", "grPosition",
+                                        "order", "delivery", "tags", "unpaidAmount"})
+_POSITIONS_STATUSES = frozenset({"prepayment", "canceled", "new",
+                                 "supOrder", "supOrderCanceled", "reservation",
+                                 "orderPicking", "delivery", "finished"})
 
 
 class TsAdminApi:
@@ -52,9 +65,6 @@ class SupplierReturnsOperations:
     def __init__(self, base: BaseAbcp):
         self._base = base
 
-    class _FieldsChecker:
-        list_fields = ["goodsReceipt", "agreement", "tags", ]
-
     async def get_list(self, creator_id: int, supplier_id: int,
                        goods_receipt_id: int,
                        agreement_ids: Union[List[int], int],
@@ -70,12 +80,10 @@ class SupplierReturnsOperations:
             tag_ids = ','.join(map(str, tag_ids))
         if isinstance(sbis_statuses, list):
             sbis_statuses = ','.join(map(str, tag_ids))
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.list_fields)
+            fields = check_fields(fields, _SR_OPERATIONS_FIELDS)
 
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.SupplierReturns.Operations.LIST, payload)
@@ -94,10 +102,8 @@ class SupplierReturnsOperations:
             tag_ids = ','.join(map(str, tag_ids))
         if isinstance(sbis_statuses, list):
             sbis_statuses = ','.join(map(str, sbis_statuses))
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
 
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.SupplierReturns.Operations.SUM, payload)
@@ -113,7 +119,7 @@ class SupplierReturnsOperations:
 
     async def update(self, id: int, number: str = None, fields: Union[List, str] = None):
         if isinstance(fields, list):
-            fields = check_fields(fields, self._FieldsChecker.list_fields)
+            fields = check_fields(fields, _SR_OPERATIONS_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.SupplierReturns.Operations.UPDATE, payload, True)
 
@@ -126,10 +132,6 @@ class SupplierReturnsPositions:
     def __init__(self, base: BaseAbcp):
         self._base = base
 
-    class _FieldsChecker:
-        list_fields = ["item", "location", "operationInfo", "tags",
-                       "goodsReceiptPos", "availableQuantity", "customerComplaintPos"]
-
     async def get_list(self, op_id: int = None, status: int = None, type: int = None,
                        goods_receipt_pos_ids: Union[List[str], str] = None,
                        item_ids: Union[List[str], str] = None,
@@ -147,12 +149,10 @@ class SupplierReturnsPositions:
             item_ids = ','.join(map(str, item_ids))
         if isinstance(goods_receipt_ids, list):
             goods_receipt_ids = ','.join(map(str, goods_receipt_ids))
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         if isinstance(fields, list):
-            fields = check_fields(fields, self._FieldsChecker.list_fields)
+            fields = check_fields(fields, _SR_POSITIONS_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.SupplierReturns.Positions.LIST, payload)
 
@@ -172,12 +172,10 @@ class SupplierReturnsPositions:
             item_ids = ','.join(map(str, item_ids))
         if isinstance(goods_receipt_ids, list):
             goods_receipt_ids = ','.join(map(str, goods_receipt_ids))
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         if isinstance(fields, list):
-            fields = check_fields(fields, self._FieldsChecker.list_fields)
+            fields = check_fields(fields, _SR_POSITIONS_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.SupplierReturns.Positions.SUM, payload)
 
@@ -196,20 +194,20 @@ class SupplierReturnsPositions:
     async def split(self, id: int, quantity: Union[int, float],
                     fields: Union[List[str], str] = None):
         if isinstance(fields, list):
-            fields = check_fields(fields, self._FieldsChecker.list_fields)
+            fields = check_fields(fields, _SR_POSITIONS_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.SupplierReturns.Positions.SPLIT, payload, True)
 
     async def update(self, id: int, type: int = None, loc_id: int = None, quantity: int = None,
                      comment: str = None, fields: Union[List[str], str] = None):
         if isinstance(fields, list):
-            fields = check_fields(fields, self._FieldsChecker.list_fields)
+            fields = check_fields(fields, _SR_POSITIONS_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.SupplierReturns.Positions.UPDATE, payload, True)
 
     async def change_status(self, id: int, status: int, fields: Union[List[str], str] = None):
         if isinstance(fields, list):
-            fields = check_fields(fields, self._FieldsChecker.list_fields)
+            fields = check_fields(fields, _SR_POSITIONS_FIELDS)
 
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.SupplierReturns.Positions.CHANGE_STATUS, payload, True)
@@ -261,10 +259,8 @@ class OrderPickings:
         :param execution_date: [необязательный] Дата проведения/выполнения в формате RFC3339, если пустая, то будет заполнена из `date`
         :return: None
         """
-        if isinstance(date, datetime):
-            date = generate(date.replace(tzinfo=pytz.utc))
-        if isinstance(execution_date, datetime):
-            execution_date = generate(execution_date.replace(tzinfo=pytz.utc))
+        date = norm_dt(date)
+        execution_date = norm_dt(execution_date)
         if isinstance(positions, dict):
             positions = [positions]
         payload = generate_payload(exclude=['positions'], **locals())
@@ -302,18 +298,15 @@ class OrderPickings:
         # ISSUE: The "d" flag is not described in the documentation
         if isinstance(output, str) and any(x not in ["e", "t", "s", "d"] for x in output):
             raise AbcpWrongParameterError('Параметр "output" принимает флаги "e", "t", "s", "d"')
-        if isinstance(limit, int) and not 1 <= limit <= 1000:
-            raise AbcpWrongParameterError('Параметр "limit" должен быть в диапазоне от 1 до 1000')
+        check_limit(limit)
         if isinstance(limit, str) and not limit.isdigit():
             raise AbcpWrongParameterError('Параметр "limit" должен быть числом')
         if statuses is not None and any(not (1 <= int(x) <= 5) for x in statuses):
             raise AbcpWrongParameterError('Параметр "statuses" принимает значения от 1 до 5')
         if isinstance(statuses, (int, str)):
             statuses = [statuses]
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         if isinstance(co_old_pos_ids, (int, str)):
             co_old_pos_ids = [co_old_pos_ids]
         payload = generate_payload(**locals())
@@ -339,8 +332,7 @@ class OrderPickings:
         """
         if isinstance(op_id, str) and not op_id.isdigit():
             raise AbcpWrongParameterError('Параметр "op_id" должен быть числом')
-        if isinstance(limit, int) and not 1 <= limit <= 1000:
-            raise AbcpWrongParameterError('Параметр "limit" должен быть в диапазоне от 1 до 1000')
+        check_limit(limit)
         if isinstance(ignore_canceled, int):
             if ignore_canceled == 0:
                 ignore_canceled = None
@@ -443,13 +435,6 @@ class CustomerComplaints:
     def __init__(self, base: BaseAbcp):
         self._base = base
 
-    @dataclass
-    class _FieldsChecker:
-        get_fields = ["orderPicking", "agreement", "tags", "posInfo"]
-        get_positions_fields = ["item", "product", "location", "orderPickingInfo", "tags", "operationInfo",
-                                "supplierReturnPos"]
-        update_fields = ["orderPicking", "agreement", "posInfo"]
-
     async def get(self, id: int = None, client_id: Union[int, str] = None, creator_id: Union[int, str] = None,
                   expert_id: Union[int, str] = None,
                   auto: Union[int, str] = None,
@@ -481,16 +466,14 @@ class CustomerComplaints:
         :param fields:
         :return:
         """
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         if isinstance(position_type, int) and (position_type < 1 or position_type > 3):
             raise AbcpWrongParameterError('position_type parameter must be between 1 and 3')
         if isinstance(position_statuses, list):
             position_statuses = ','.join(map(str, position_statuses))
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.get_fields)
+            fields = check_fields(fields, _CC_GET_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.CustomerComplaints.GET, payload)
 
@@ -536,10 +519,8 @@ class CustomerComplaints:
         if isinstance(sort, str) and sort not in ('status', 'createDate'):
             raise AbcpWrongParameterError('Параметр "sort" может принимать одно из значений: "status" или "createDate"')
 
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         if isinstance(picking_ids, list):
             picking_ids = ','.join(map(str, picking_ids))
         if isinstance(order_picking_good_ids, list):
@@ -553,7 +534,7 @@ class CustomerComplaints:
         if isinstance(type, int) and not 1 <= type <= 3:
             raise AbcpWrongParameterError('Параметр "type" должен быть в диапазоне от 1 до 3')
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.get_positions_fields)
+            fields = check_fields(fields, _CC_GET_POSITIONS_FIELDS)
         payload = generate_payload(exclude=['old_item_id'], **locals())
         return await self._base.request(_Methods.TsAdmin.CustomerComplaints.GET_POSITIONS, payload)
 
@@ -596,11 +577,8 @@ class CustomerComplaints:
                                        customer_complaint_id: int,
                                        customer_complaint: str,
                                        custom_complaint_file: str = None):
-        with open(custom_complaint_file, "rb") as ccf:
-            encoded_string = base64.b64encode(ccf.read()).decode("utf-8")
-        custom_complaint_file = f"{encoded_string}"
-        del ccf
-        del encoded_string
+        custom_complaint_file = await asyncio.get_running_loop().run_in_executor(
+            None, encode_file_base64, custom_complaint_file)
         if isinstance(positions, dict):
             positions = [positions]
         payload = generate_payload(**locals())
@@ -656,17 +634,14 @@ class CustomerComplaints:
         :return:
         """
         if os.path.isfile(custom_complaint_file):
-            with open(custom_complaint_file, "rb") as ccf:
-                encoded_string = base64.b64encode(ccf.read()).decode("utf-8")
-            custom_complaint_file = f"{encoded_string}"
-            del ccf
-            del encoded_string
+            custom_complaint_file = await asyncio.get_running_loop().run_in_executor(
+                None, encode_file_base64, custom_complaint_file)
         else:
             raise TypeError('Неверно передан путь к файлу')
         if all(x is None for x in [number, expert_id]):
             raise AbcpParameterRequired('Один из параметров "number" или "expert_id" должен быть указан')
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.update_fields)
+            fields = check_fields(fields, _CC_UPDATE_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.CustomerComplaints.UPDATE, payload, True)
 
@@ -680,16 +655,12 @@ class CustomerComplaints:
         :return:
         """
         if os.path.isfile(custom_complaint_file):
-            with open(custom_complaint_file, "rb") as ccf:
-                encoded_string = base64.b64encode(ccf.read()).decode("utf-8")
-
-            custom_complaint_file = f"{encoded_string}"
-            del ccf
-            del encoded_string
+            custom_complaint_file = await asyncio.get_running_loop().run_in_executor(
+                None, encode_file_base64, custom_complaint_file)
         else:
             raise TypeError('Неверно передан путь к файлу')
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.update_fields)
+            fields = check_fields(fields, _CC_UPDATE_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.CustomerComplaints.UPDATE_CUSTOM_FILE, payload, True)
 
@@ -716,9 +687,6 @@ class Orders:
         self._base = base
         self.messages = Messages(base)
 
-    class _FieldsChecker:
-        fields = ["deliveries", "agreement", "tags", "posInfo", "amounts"]
-
     async def create(self, client_id: Union[str, int], number: Union[int, str] = None,
                      agreement_id: Union[int, str] = None,
                      create_time: Union[datetime, str] = None, manager_id: Union[int, str] = None,
@@ -736,10 +704,9 @@ class Orders:
         :param fields: дополнительная информация ["agreement", "tags", "posInfo", "deliveries", "amounts"]
         :return:
         """
-        if isinstance(create_time, datetime):
-            create_time = generate(create_time.replace(tzinfo=pytz.utc))
+        create_time = norm_dt(create_time)
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.fields)
+            fields = check_fields(fields, _ORDERS_FIELDS)
 
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.Orders.CREATE, payload, True)
@@ -783,13 +750,10 @@ class Orders:
         :return:
         """
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.fields)
-        if isinstance(create_time, datetime):
-            create_time = generate(create_time.replace(tzinfo=pytz.utc))
-        if isinstance(delivery_start_time, datetime):
-            delivery_start_time = generate(delivery_start_time.replace(tzinfo=pytz.utc))
-        if isinstance(delivery_end_time, datetime):
-            delivery_end_time = generate(delivery_end_time.replace(tzinfo=pytz.utc))
+            fields = check_fields(fields, _ORDERS_FIELDS)
+        create_time = norm_dt(create_time)
+        delivery_start_time = norm_dt(delivery_start_time)
+        delivery_end_time = norm_dt(delivery_end_time)
         if isinstance(positions, (int, str)):
             positions = [positions]
         payload = generate_payload(
@@ -843,18 +807,12 @@ class Orders:
             product_ids = ','.join(map(str, product_ids))
         if isinstance(order_ids, list):
             order_ids = ','.join(map(str, order_ids))
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
-        if isinstance(update_date_start, datetime):
-            update_date_start = generate(update_date_start.replace(tzinfo=pytz.utc))
-        if isinstance(update_date_end, datetime):
-            update_date_end = generate(update_date_end.replace(tzinfo=pytz.utc))
-        if isinstance(deadline_date_start, datetime):
-            deadline_date_start = generate(deadline_date_start.replace(tzinfo=pytz.utc))
-        if isinstance(deadline_date_end, datetime):
-            deadline_date_end = generate(deadline_date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
+        update_date_start = norm_dt(update_date_start)
+        update_date_end = norm_dt(update_date_end)
+        deadline_date_start = norm_dt(deadline_date_start)
+        deadline_date_end = norm_dt(deadline_date_end)
 
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.Orders.LIST, payload)
@@ -900,7 +858,7 @@ class Orders:
         :return:
         """
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.fields)
+            fields = check_fields(fields, _ORDERS_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.Orders.UPDATE, payload, True)
 
@@ -919,7 +877,7 @@ class Orders:
         if isinstance(merge_orders_ids, (int, str)):
             merge_orders_ids = [merge_orders_ids]
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.fields)
+            fields = check_fields(fields, _ORDERS_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.Orders.MERGE, payload, True)
 
@@ -939,7 +897,7 @@ class Orders:
         if isinstance(position_ids, (int, str)):
             position_ids = [position_ids]
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.fields)
+            fields = check_fields(fields, _ORDERS_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.Orders.SPLIT, payload, True)
 
@@ -956,7 +914,7 @@ class Orders:
         :return:
         """
         if fields is not None:
-            fields = check_fields(fields, self._FieldsChecker.fields)
+            fields = check_fields(fields, _ORDERS_FIELDS)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.Orders.REPRICE, payload, True)
 
@@ -1209,14 +1167,6 @@ class Positions:
         self._base = base
         self.messages = PositionsMessages(base)
 
-    class _FieldsChecker:
-        additional_info = ["reserv", "product", "orderPicking",
-                           "customerComplaintPoses", "supplierOrder", "grPosition",
-                           "order", "delivery", "tags", "unpaidAmount"]
-        statuses = ["prepayment", "canceled", "new",
-                    "supOrder", "supOrderCanceled", "reservation",
-                    "orderPicking", "delivery", "finished"]
-
     async def get(self, position_id: Union[str, int], additional_info: Union[List, str] = None):
         """
         Получение одной позиции
@@ -1230,7 +1180,7 @@ class Positions:
         :return:
         """
         if additional_info is not None:
-            additional_info = check_fields(additional_info, self._FieldsChecker.additional_info)
+            additional_info = check_fields(additional_info, _POSITIONS_ADDITIONAL_INFO)
 
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.Positions.GET, payload)
@@ -1326,7 +1276,7 @@ class Positions:
         if isinstance(tag_ids, list):
             tag_ids = ','.join(map(str, tag_ids))
         if statuses is not None:
-            statuses = check_fields(statuses, self._FieldsChecker.statuses)
+            statuses = check_fields(statuses, _POSITIONS_STATUSES)
         if isinstance(no_manager_assigned, bool):
             no_manager_assigned = str(no_manager_assigned)
         payload = generate_payload(**locals())
@@ -1390,10 +1340,8 @@ class Positions:
         :param status: string, статус позиции, Новый или Предоплата
         :return:
         """
-        if isinstance(deadline_time, datetime):
-            deadline_time = generate(deadline_time.replace(tzinfo=pytz.utc))
-        if isinstance(deadline_time_max, datetime):
-            deadline_time_max = generate(deadline_time_max.replace(tzinfo=pytz.utc))
+        deadline_time = norm_dt(deadline_time)
+        deadline_time_max = norm_dt(deadline_time_max)
         if isinstance(status, str) and all(status != x for x in ['new', 'prepayment']):
             raise AbcpWrongParameterError('Параметр "status" может принимать значения "new" или "prepayment"')
         if isinstance(client_refusal, bool):
@@ -1604,8 +1552,7 @@ class GoodReceipts:
         :param sup_number: номер отгрузки поставщика
         :return:
         """
-        if isinstance(limit, int) and not 1 <= limit <= 1000:
-            raise AbcpWrongParameterError('Параметр "limit" должен быть в диапазоне от 1 до 1000')
+        check_limit(limit)
         if isinstance(output, str) and not all(x in 'des' for x in output):
             raise AbcpWrongParameterError('Параметр "output" должен состоять из  ["d", "e", "s"]')
         if isinstance(statuses, int) and not 1 <= statuses <= 3:
@@ -1615,10 +1562,8 @@ class GoodReceipts:
                 statuses = ','.join(map(str, statuses))
             else:
                 raise AbcpWrongParameterError('Параметр "statuses" принимет значения от 1 до 3')
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         payload = generate_payload(**locals())
         return await self._base.request(_Methods.TsAdmin.GoodReceipts.GET, payload)
 
@@ -1638,8 +1583,7 @@ class GoodReceipts:
         :return:
         """
 
-        if isinstance(limit, int) and not 1 <= limit <= 1000:
-            raise AbcpWrongParameterError('Параметр "limit" должен быть в диапазоне от 1 до 1000')
+        check_limit(limit)
         if isinstance(output, str) and output != 'e':
             raise AbcpWrongParameterError('Параметр "output" принимает только значение "e"')
         payload = generate_payload(**locals())
@@ -1969,10 +1913,8 @@ class Payments:
         :param fields:
         :return:
         """
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         if isinstance(status, list):
             if any(x not in self._Status.status for x in status):
                 raise AbcpWrongParameterError(
@@ -2005,8 +1947,7 @@ class Payments:
         :param fields:
         :return:
         """
-        if isinstance(date, datetime):
-            date = generate(date.replace(tzinfo=pytz.utc))
+        date = norm_dt(date)
         if isinstance(fields, list):
             fields = ','.join(fields)
 
@@ -2076,10 +2017,8 @@ class Agreements:
         :param skip:
         :return:
         """
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
 
         if isinstance(contractor_ids, int) or isinstance(contractor_ids, str):
             contractor_ids = [contractor_ids]
@@ -1,15 +1,53 @@
-import base64
+import asyncio
 from datetime import datetime
 from typing import Union, List, Dict
 
-import pytz
-from pyrfc3339 import generate
-
 from ..api import _Methods
 from ..base import BaseAbcp
 from ..exceptions import AbcpWrongParameterError
-from ..utils.fields_checker import check_fields
-from ..utils.payload import generate_payload
+from ..utils.dates import norm_dt
+from ..utils.fields_checker import check_fields, check_limit
+from ..utils.payload import generate_payload, generate_payload_scalar, encode_file_base64
+
+_TsClientMethods = _Methods.TsClient
+
+_CC_GET_FIELDS = frozenset({"orderPicking", "agreement", "posInfo"})
+_CC_GET_POSITIONS_FIELDS = frozenset({"product", "orderPickingInfo", "operationInfo", "supplierReturnPos"})
+_POSITIONS_ADDITIONAL_INFO = frozenset({"delivery", "unpaidAmount"})
+_POSITIONS_STATUSES = frozenset({"prepayment", "canceled", "new",
+                                 "supOrder", "supOrderCanceled", "reservation",
+                                 "orderPicking", "delivery", "finished"})
+
+
+def _fmt_dt(value):
+    """Приводит datetime к строке в формате %Y-%m-%d %H:%M:%S, остальные значения возвращает как есть"""
+    if isinstance(value, datetime):
+        return f'{value:%Y-%m-%d %H:%M:%S}'
+    return value
+
+
+def _as_list(value):
+    if value is None or isinstance(value, list):
+        return value
+    return [value]
+
+
+def _join_list(value):
+    """Склеивает list в строку через запятую, остальные значения возвращает как есть"""
+    if not isinstance(value, list):
+        return value
+    return ','.join(map(str, value))
+
+
+def _drop_none(payload: dict):
+    """Убирает параметры со значением None, как это делает generate_payload"""
+    return {key: value for key, value in payload.items() if value is not None}
+
+
+def _check_status_1_3(name, value):
+    if isinstance(value, int) and not 1 <= value <= 3 or \
+            isinstance(value, list) and not all(1 <= int(x) <= 3 for x in value):
+        raise AbcpWrongParameterError(f'Параметр "{name}" принимет значения от 1 до 3')
 
 
 class TsClientApi:
@@ -46,12 +84,10 @@ class GoodReceipts:
         :param sup_shipment_date: дата и время отгрузки поставщика <br> `str` в формате %Y-%m-%d %H:%M:%S или datetime object<br>
         :return: id `obj`
         """
-        if isinstance(positions, dict):
-            positions = [positions]
+        positions = _as_list(positions)
+        sup_shipment_date = _fmt_dt(sup_shipment_date)
         payload = generate_payload(**locals())
-        if isinstance(sup_shipment_date, datetime):
-            sup_shipment_date = f'{sup_shipment_date:%Y-%m-%d %H:%M:%S}'
-        return await self._base.request(_Methods.TsClient.GoodReceipts.CREATE, payload, True)
+        return await self._base.request(_TsClientMethods.GoodReceipts.CREATE, payload, True)
 
     async def get(self, limit: int = None, skip: int = None,
                   output: str = None,
@@ -80,21 +116,15 @@ class GoodReceipts:
         :param sup_number:
         :return:
         """
-        if isinstance(limit, int) and not 1 <= limit <= 1000:
-            raise AbcpWrongParameterError('Параметр "limit" может принимать значения от 1 до 1000')
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        check_limit(limit)
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         if isinstance(output, str) and not all(x in 'des' for x in output):
             raise AbcpWrongParameterError('Параметр "output" должен состоять из  ["d", "e", "s"]')
-        if isinstance(statuses, list):
-            if all(1 <= int(x) <= 3 for x in statuses):
-                statuses = ','.join(map(str, statuses))
-            else:
-                raise AbcpWrongParameterError('Параметр "statuses" принимет значения от 1 до 3')
+        _check_status_1_3('statuses', statuses)
+        statuses = _join_list(statuses)
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.GoodReceipts.GET, payload)
+        return await self._base.request(_TsClientMethods.GoodReceipts.GET, payload)
 
     async def get_positions(self, op_id: Union[str, int], limit: int = None, skip: int = None,
                             output: str = None, product_id: Union[int, str] = None, auto: str = None):
@@ -111,14 +141,13 @@ class GoodReceipts:
         :param auto:
         :return:
         """
-        if isinstance(limit, int) and not 1 <= limit <= 1000:
-            raise AbcpWrongParameterError('Параметр "limit" может принимать значения от 1 до 1000')
+        check_limit(limit)
         if isinstance(output, str) and output != 'e':
             raise AbcpWrongParameterError('Параметр "output" принимает только значение "e"')
         if isinstance(auto, str) and (len(auto) < 3):
             raise AbcpWrongParameterError('Параметр "auto" должен состоять минимум из 3 символов')
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.GoodReceipts.GET_POSITIONS, payload)
+        payload = generate_payload_scalar(**locals())
+        return await self._base.request(_TsClientMethods.GoodReceipts.GET_POSITIONS, payload)
 
 
 class OrderPickings:
@@ -151,23 +180,15 @@ class OrderPickings:
         :param co_old_pos_ids: список идентификаторов позиций старых заказов
         :return:
         """
-        if isinstance(limit, int) and not 1 <= limit <= 1000:
-            raise AbcpWrongParameterError('Параметр "limit" может принимать значения от 1 до 1000')
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
-        if isinstance(status, int) and not 1 <= status <= 3:
-            raise AbcpWrongParameterError('Параметр "status" принимет значения от 1 до 3')
-        if isinstance(status, list):
-            if all(1 <= x <= 3 for x in status):
-                statuses = ','.join(map(str, status))
-            else:
-                raise AbcpWrongParameterError('Параметр "status" принимет значения от 1 до 3')
+        check_limit(limit)
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
+        _check_status_1_3('status', status)
+        status = _join_list(status)
         if isinstance(output, str) and (not all(x in 'des' for x in output) or len(output) > 3):
             raise AbcpWrongParameterError('Параметр "output" должен состоять из  ["d", "e", "s"]')
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.OrderPickings.GET, payload)
+        return await self._base.request(_TsClientMethods.OrderPickings.GET, payload)
 
     async def get_positions(self, op_id: Union[str, int], limit: int = None, skip: int = None, output: str = None,
                             product_id: Union[int, str] = None,
@@ -186,26 +207,16 @@ class OrderPickings:
         :param ignore_canceled: Признак не возвращать позиции аннулированных операций
         :return:
         """
-
+        check_limit(limit)
         if isinstance(ignore_canceled, int):
-            if ignore_canceled == 0:
-                ignore_canceled = None
-            elif ignore_canceled != 1:
+            if ignore_canceled not in (0, 1):
                 raise AbcpWrongParameterError(
                     'В параметр "ignore_canceled" передеаются значения 1 или True, 0 или False (В данном случае можно не указывать) ')
-
-        if isinstance(ignore_canceled, bool):
-            if ignore_canceled:
-                ignore_canceled = int(ignore_canceled)
-            else:
-                ignore_canceled = None
-
-        if isinstance(output, str) and (not all(x in 'oe' for x in output) or len(output) > 2):
+            ignore_canceled = 1 if ignore_canceled else None
+        if output is not None and (not isinstance(output, str) or output.strip('oe') or len(output) > 2):
             raise AbcpWrongParameterError('Параметр "output" должен состоять из  ["o", "e"]')
-        if output is not None:
-            raise AbcpWrongParameterError('output must be a string')
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.OrderPickings.GET_POSITIONS, payload)
+        payload = generate_payload_scalar(**locals())
+        return await self._base.request(_TsClientMethods.OrderPickings.GET_POSITIONS, payload)
 
 
 class CustomerComplaints:
@@ -213,8 +224,8 @@ class CustomerComplaints:
         self._base = base
 
     class FieldsChecker:
-        get_fields = ["orderPicking", "agreement", "posInfo"]
-        get_positions_fields = ["product", "orderPickingInfo", "operationInfo", "supplierReturnPos"]
+        get_fields = _CC_GET_FIELDS
+        get_positions_fields = _CC_GET_POSITIONS_FIELDS
 
     async def get(self, auto: Union[str, int] = None, creator_id: Union[int, str] = None,
                   expert_id: Union[int, str] = None,
@@ -249,18 +260,14 @@ class CustomerComplaints:
                     posInfo - информация о количестве позиций во всех возможных статусах
         :return:
         """
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
-        if isinstance(tag_ids, (int, str)):
-            tag_ids = [tag_ids]
-        if isinstance(position_statuses, list):
-            position_statuses = ','.join(map(str, position_statuses))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
+        tag_ids = _as_list(tag_ids)
+        position_statuses = _join_list(position_statuses)
         if fields is not None:
-            fields = check_fields(fields, self.FieldsChecker.get_fields)
+            fields = check_fields(fields, _CC_GET_FIELDS)
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.CustomerComplaints.GET, payload)
+        return await self._base.request(_TsClientMethods.CustomerComplaints.GET, payload)
 
     async def get_positions(self, op_id: Union[str, int],
                             order_picking_good_id: Union[int, str] = None,
@@ -301,19 +308,14 @@ class CustomerComplaints:
                         supplierReturnPos - связанный возврат поставщику (null, если такого нет)
         :return:
         """
-        if isinstance(order_picking_good_ids, list):
-            order_picking_good_ids = ','.join(map(str, order_picking_good_ids))
+        order_picking_good_ids = _join_list(order_picking_good_ids)
 
-        if isinstance(picking_ids, list):
-            picking_ids = ','.join(map(str, picking_ids))
+        picking_ids = _join_list(picking_ids)
 
-        if isinstance(old_co_position_ids, list):
-            old_co_position_ids = ','.join(map(str, old_co_position_ids))
+        old_co_position_ids = _join_list(old_co_position_ids)
 
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
         if isinstance(status, int) and not 1 <= status <= 6:
             raise AbcpWrongParameterError('Параметр "status" должен быть в диапазоне от 1 до 6')
         if isinstance(type, int) and not 1 <= type <= 3:
@@ -321,10 +323,10 @@ class CustomerComplaints:
         if isinstance(output, str) and output != 'e':
             raise AbcpWrongParameterError('Параметр "output" принимает только значение "e"')
         if fields is not None:
-            fields = check_fields(fields, self.FieldsChecker.get_positions_fields)
+            fields = check_fields(fields, _CC_GET_POSITIONS_FIELDS)
 
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.CustomerComplaints.GET_POSITIONS, payload)
+        return await self._base.request(_TsClientMethods.CustomerComplaints.GET_POSITIONS, payload)
 
     async def create(self, order_picking_id: Union[str, int], positions: Union[List[Dict], Dict]):
         """
@@ -337,24 +339,19 @@ class CustomerComplaints:
         :return:
         """
 
-        if isinstance(positions, dict):
-            positions = [positions]
+        positions = _as_list(positions)
         payload = generate_payload(exclude=['positions'], **locals())
-        return await self._base.request(_Methods.TsClient.CustomerComplaints.CREATE, payload, True)
+        return await self._base.request(_TsClientMethods.CustomerComplaints.CREATE, payload, True)
 
     async def create_position_multiple(self, positions: Union[List[Dict], Dict],
                                        customer_complaint_id: int,
                                        customer_complaint: str,
                                        custom_complaint_file: str = None):
-        with open(custom_complaint_file, "rb") as ccf:
-            encoded_string = base64.b64encode(ccf.read()).decode("utf-8")
-        custom_complaint_file = f"{encoded_string}"
-        del ccf
-        del encoded_string
-        if isinstance(positions, dict):
-            positions = [positions]
+        custom_complaint_file = await asyncio.get_running_loop().run_in_executor(
+            None, encode_file_base64, custom_complaint_file)
+        positions = _as_list(positions)
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.CustomerComplaints.CREATE_POSITION_MULTIPLE, payload, True)
+        return await self._base.request(_TsClientMethods.CustomerComplaints.CREATE_POSITION_MULTIPLE, payload, True)
 
     async def update_position(self, id: int, quantity: Union[str, int]):
         """
@@ -368,8 +365,8 @@ class CustomerComplaints:
         :param quantity: количество
         :return:
         """
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.CustomerComplaints.UPDATE, payload, True)
+        payload = _drop_none({'id': id, 'quantity': quantity})
+        return await self._base.request(_TsClientMethods.CustomerComplaints.UPDATE, payload, True)
 
     async def cancel_position(self, id: int):
         """
@@ -383,8 +380,8 @@ class CustomerComplaints:
 
         :return:
         """
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.CustomerComplaints.CANCEL, payload, True)
+        payload = _drop_none({'id': id})
+        return await self._base.request(_TsClientMethods.CustomerComplaints.CANCEL, payload, True)
 
 
 class Orders:
@@ -407,15 +404,13 @@ class Orders:
         :param positions: список ID позиций корзины
         :return:
         """
-        if isinstance(create_time, datetime):
-            create_time = generate(create_time.replace(tzinfo=pytz.utc))
-        if isinstance(positions, (int, str)):
-            positions = [positions]
+        create_time = norm_dt(create_time)
+        positions = _as_list(positions)
         payload = generate_payload(
             exclude=['delivery_address', 'delivery_person',
                      'delivery_contact', 'delivery_comment', 'delivery_method_id'],
             **locals())
-        return await self._base.request(_Methods.TsClient.Orders.CREATE, payload, True)
+        return await self._base.request(_TsClientMethods.Orders.CREATE, payload, True)
 
     async def get_list(self, number: Union[str, int] = None, agreement_id: Union[int, str] = None,
                        manager_id: Union[int, str] = None,
@@ -449,26 +444,17 @@ class Orders:
         :param limit: максимальное количество заказов, которое должно быть возвращено в ответе
         :return:
         """
-        if isinstance(position_statuses, list):
-            position_statuses = ','.join(map(str, position_statuses))
-        if isinstance(product_ids, list):
-            product_ids = ','.join(map(str, product_ids))
-        if isinstance(order_ids, list):
-            order_ids = ','.join(map(str, order_ids))
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
-        if isinstance(update_date_start, datetime):
-            update_date_start = generate(update_date_start.replace(tzinfo=pytz.utc))
-        if isinstance(update_date_end, datetime):
-            update_date_end = generate(update_date_end.replace(tzinfo=pytz.utc))
-        if isinstance(deadline_date_start, datetime):
-            deadline_date_start = generate(deadline_date_start.replace(tzinfo=pytz.utc))
-        if isinstance(deadline_date_end, datetime):
-            deadline_date_end = generate(deadline_date_end.replace(tzinfo=pytz.utc))
+        position_statuses = _join_list(position_statuses)
+        product_ids = _join_list(product_ids)
+        order_ids = _join_list(order_ids)
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
+        update_date_start = norm_dt(update_date_start)
+        update_date_end = norm_dt(update_date_end)
+        deadline_date_start = norm_dt(deadline_date_start)
+        deadline_date_end = norm_dt(deadline_date_end)
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Orders.GET_LIST, payload)
+        return await self._base.request(_TsClientMethods.Orders.GET_LIST, payload)
 
     async def get_order(self, order_id: Union[str, int]):
         """
@@ -479,8 +465,8 @@ class Orders:
         :param order_id: Идентификатор заказа.
         :return:
         """
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Orders.GET, payload)
+        payload = _drop_none({'orderId': order_id})
+        return await self._base.request(_TsClientMethods.Orders.GET, payload)
 
     async def refuse(self, order_id: Union[str, int]):
         """
@@ -491,8 +477,8 @@ class Orders:
         :param order_id:
         :return:
         """
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Orders.REFUSE, payload, True)
+        payload = _drop_none({'orderId': order_id})
+        return await self._base.request(_TsClientMethods.Orders.REFUSE, payload, True)
 
 
 class Cart:
@@ -514,8 +500,8 @@ class Cart:
         :param agreement_id: идентификатор договора, если не указан, то используется активный договор с клиентом по умолчанию
         :return:
         """
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Cart.CREATE, payload, True)
+        payload = generate_payload_scalar(**locals())
+        return await self._base.request(_TsClientMethods.Cart.CREATE, payload, True)
 
     async def update(self, position_id: Union[str, int], quantity: int):
         """
@@ -527,8 +513,8 @@ class Cart:
         :param quantity: новое количество
         :return:
         """
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Cart.UPDATE, payload, True)
+        payload = _drop_none({'positionId': position_id, 'quantity': quantity})
+        return await self._base.request(_TsClientMethods.Cart.UPDATE, payload, True)
 
     async def get_list(self, position_ids: Union[List, str, int] = None, agreement_id: Union[int, str] = None,
                        limit: int = None,
@@ -543,10 +529,9 @@ class Cart:
         :param skip: количество позиций корзины в ответе, которое нужно пропустить
         :return:
         """
-        if isinstance(position_ids, list):
-            position_ids = ','.join(map(str, position_ids))
+        position_ids = _join_list(position_ids)
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Cart.GET_LIST, payload, True)
+        return await self._base.request(_TsClientMethods.Cart.GET_LIST, payload, True)
 
     async def exist(self, agreement_id: Union[str, int], brand: str, number_fix: str):
         """
@@ -559,8 +544,8 @@ class Cart:
         :param number_fix: артикул по стандарту ABCP
         :return:
         """
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Cart.EXIST, payload)
+        payload = _drop_none({'agreementId': agreement_id, 'brand': brand, 'numberFix': number_fix})
+        return await self._base.request(_TsClientMethods.Cart.EXIST, payload)
 
     async def summary(self, agreement_id: Union[int, str] = None):
         """
@@ -570,8 +555,8 @@ class Cart:
         :param agreement_id: идентификатор договора, если не указан, то используется активный договор с клиентом по умолчанию
         :return:
         """
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Cart.SUMMARY, payload)
+        payload = _drop_none({'agreementId': agreement_id})
+        return await self._base.request(_TsClientMethods.Cart.SUMMARY, payload)
 
     async def clear(self, agreement_id: Union[str, int]):
         """
@@ -581,8 +566,8 @@ class Cart:
         :param agreement_id: идентификатор договора
         :return:
         """
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Cart.CLEAR, payload, True)
+        payload = _drop_none({'agreementId': agreement_id})
+        return await self._base.request(_TsClientMethods.Cart.CLEAR, payload, True)
 
     async def delete_positions(self, position_ids: Union[List, str, int]):
         """
@@ -592,11 +577,10 @@ class Cart:
         :param position_ids:
         :return:
         """
-        if isinstance(position_ids, (int, str)):
-            position_ids = [position_ids]
+        position_ids = _as_list(position_ids)
 
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Cart.DELETE, payload, True)
+        return await self._base.request(_TsClientMethods.Cart.DELETE, payload, True)
 
 
 class Positions:
@@ -604,10 +588,8 @@ class Positions:
         self._base = base
 
     class FieldsChecker:
-        additional_info = ["delivery", "unpaidAmount"]
-        statuses = ["prepayment", "canceled", "new",
-                    "supOrder", "supOrderCanceled", "reservation",
-                    "orderPicking", "delivery", "finished"]
+        additional_info = _POSITIONS_ADDITIONAL_INFO
+        statuses = _POSITIONS_STATUSES
 
     async def get_position(self, position_id: Union[str, int], additional_info: Union[List, str] = None):
         """
@@ -617,9 +599,9 @@ class Positions:
         :return:
         """
         if additional_info is not None:
-            additional_info = check_fields(additional_info, self.FieldsChecker.additional_info)
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Positions.GET, payload)
+            additional_info = check_fields(additional_info, _POSITIONS_ADDITIONAL_INFO)
+        payload = generate_payload_scalar(position_id=position_id, additional_info=additional_info)
+        return await self._base.request(_TsClientMethods.Positions.GET, payload)
 
     async def get_list(self, brand: str = None, message: str = None, agreement_id: Union[int, str] = None,
                        manager_id: Union[int, str] = None,
@@ -660,40 +642,34 @@ class Positions:
         :param additional_info: доп. информация. Значения `str` или List ["delivery", "unpaidAmount"]
         :return:
         """
-        if isinstance(date_start, datetime):
-            date_start = f'{date_start:%Y-%m-%d %H:%M:%S}'
-        if isinstance(date_end, datetime):
-            date_end = f'{date_end:%Y-%m-%d %H:%M:%S}'
-        if isinstance(update_date_start, datetime):
-            update_date_start = f'{update_date_start:%Y-%m-%d %H:%M:%S}'
-        if isinstance(update_date_end, datetime):
-            update_date_end = f'{update_date_end:%Y-%m-%d %H:%M:%S}'
-        if isinstance(deadline_date_start, datetime):
-            deadline_date_start = f'{deadline_date_start:%Y-%m-%d %H:%M:%S}'
-        if isinstance(deadline_date_end, datetime):
-            deadline_date_end = f'{deadline_date_end:%Y-%m-%d %H:%M:%S}'
-        if isinstance(product_ids, (int, str)):
-            product_ids = [product_ids]
-        if isinstance(route_ids, (int, str)):
-            route_ids = [route_ids]
-        if isinstance(distributor_ids, (int, str)):
-            distributor_ids = [distributor_ids]
-        if isinstance(ids, (int, str)):
-            ids = [ids]
-        if isinstance(order_ids, (int, str)):
-            order_ids = [order_ids]
-        if isinstance(statuses, str):
-            statuses = [statuses]
-        if isinstance(tag_ids, list):
-            tag_ids = ','.join(map(str, tag_ids))
+        date_start = _fmt_dt(date_start)
+        date_end = _fmt_dt(date_end)
+        update_date_start = _fmt_dt(update_date_start)
+        update_date_end = _fmt_dt(update_date_end)
+        deadline_date_start = _fmt_dt(deadline_date_start)
+        deadline_date_end = _fmt_dt(deadline_date_end)
+        product_ids = _as_list(product_ids)
+        route_ids = _as_list(route_ids)
+        distributor_ids = _as_list(distributor_ids)
+        ids = _as_list(ids)
+        order_ids = _as_list(order_ids)
+        statuses = _as_list(statuses)
+        tag_ids = _join_list(tag_ids)
         if statuses is not None:
-            statuses = check_fields(statuses, self.FieldsChecker.statuses)
+            statuses = check_fields(statuses, _POSITIONS_STATUSES)
         if additional_info is not None:
-            additional_info = check_fields(additional_info, self.FieldsChecker.additional_info)
+            additional_info = check_fields(additional_info, _POSITIONS_ADDITIONAL_INFO)
         if isinstance(no_manager_assigned, bool):
             no_manager_assigned = str(no_manager_assigned)
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Positions.GET_LIST, payload)
+        payload = generate_payload(brand=brand, message=message, agreement_id=agreement_id, manager_id=manager_id,
+                                   no_manager_assigned=no_manager_assigned,
+                                   date_start=date_start, date_end=date_end,
+                                   update_date_start=update_date_start, update_date_end=update_date_end,
+                                   deadline_date_start=deadline_date_start, deadline_date_end=deadline_date_end,
+                                   route_ids=route_ids, distributor_ids=distributor_ids, ids=ids,
+                                   order_ids=order_ids, product_ids=product_ids, statuses=statuses,
+                                   tag_ids=tag_ids, limit=limit, skip=skip, additional_info=additional_info)
+        return await self._base.request(_TsClientMethods.Positions.GET_LIST, payload)
 
     async def cancel(self, position_id: Union[str, int], additional_info: Union[List, str] = None):
         """
@@ -703,13 +679,13 @@ class Positions:
         :return:
         """
         if additional_info is not None:
-            additional_info = check_fields(additional_info, self.FieldsChecker.additional_info)
-        payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Positions.CANCEL, payload, True)
+            additional_info = check_fields(additional_info, _POSITIONS_ADDITIONAL_INFO)
+        payload = generate_payload_scalar(position_id=position_id, additional_info=additional_info)
+        return await self._base.request(_TsClientMethods.Positions.CANCEL, payload, True)
 
     async def mass_cancel(self, position_ids: Union[List, str, int], additional_info: Union[List, str] = None):
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Positions.MASS_CANCEL, payload, True)
+        return await self._base.request(_TsClientMethods.Positions.MASS_CANCEL, payload, True)
 
 
 class Agreements:
@@ -744,10 +720,8 @@ class Agreements:
         :param skip:
         :return:
         """
-        if isinstance(date_start, datetime):
-            date_start = generate(date_start.replace(tzinfo=pytz.utc))
-        if isinstance(date_end, datetime):
-            date_end = generate(date_end.replace(tzinfo=pytz.utc))
+        date_start = norm_dt(date_start)
+        date_end = norm_dt(date_end)
 
         if isinstance(contractor_ids, int) or isinstance(contractor_ids, str):
             contractor_ids = [contractor_ids]
@@ -763,4 +737,4 @@ class Agreements:
             is_default = str(is_default)
 
         payload = generate_payload(**locals())
-        return await self._base.request(_Methods.TsClient.Agreements.get_list, payload)
+        return await self._base.request(_TsClientMethods.Agreements.get_list, payload)
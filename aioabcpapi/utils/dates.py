@@ -0,0 +1,13 @@
+from datetime import datetime, timezone
+
+
+def norm_dt(value):
+    """
+    Приводит datetime к строке RFC3339 в UTC, остальные значения возвращает как есть.
+    datetime с часовым поясом переводится в UTC, datetime без часового пояса считается уже заданным в UTC
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return f'{value:%Y-%m-%dT%H:%M:%S}Z'
+    return value
@@ -1,5 +1,7 @@
+import base64
 import logging
 import os
+from functools import lru_cache, partial
 from io import BufferedReader
 
 from aiohttp import FormData
@@ -7,53 +9,100 @@ from aiohttp import FormData
 from aioabcpapi.exceptions import FileSizeExceeded
 
 DEFAULT_FILTER = ['self', 'cls', 'kwargs']
+_DEFAULT_FILTER_SET = frozenset(DEFAULT_FILTER)
+_DEFAULT_EXCLUDE_SET = frozenset({'order_params', 'distributors', 'note', 'del_note',
+                                  'basket_positions', 'sip'})
 logger = logging.getLogger('utils/payload')
 
 
+@lru_cache(maxsize=512)
 def get_pascal_case_key(key: str):
-    return ''.join([*map(str.title, key.split('_'))])
+    return ''.join(map(str.title, key.split('_')))
 
 
+@lru_cache(maxsize=512)
 def get_camel_case_key(key: str):
-    return f"{''.join([key.split('_')[0].lower(), *map(str.title, key.split('_')[1:])])}"
+    head, *tail = key.split('_')
+    return head.lower() + ''.join(map(str.title, tail))
 
 
+_EXCLUDED_KEYS = {
+    'order_positions': 'order[positions][{index}][{key}]',
+    'positions': 'positions[{index}][{key}]',
+    'articles_catalog': 'articles[{index}][{key}]',
+    'properties': 'properties[{key}][{index}]',
+    'order_params': 'orderParams[{key}]',
+    'distributors': 'distributors[{index}][{key}]',
+    'search': 'search[{index}][{key}]',
+    'basket_positions': 'positions[{index}][{key}]',
+    'goods_group': 'goods_group',
+    'note': 'order[notes][0][value]',
+    'del_note': 'order[notes][0][value]',
+    'delivery_address': 'delivery[meetData][address]',
+    'delivery_person': 'delivery[meetData][person]',
+    'delivery_contact': 'delivery[meetData][contact]',
+    'delivery_comment': 'delivery[meetData][comment]',
+    'delivery_employee_contact': 'delivery[meetData][employeeContact]',
+    'delivery_employee_person': 'delivery[meetData][employeePerson]',
+    'delivery_reseller_comment': 'delivery[meetData][resellerComment]',
+    'delivery_start_time': 'delivery[timeInterval][startTime]',
+    'delivery_end_time': 'delivery[timeInterval][endTime]',
+    'delivery_method_id': 'delivery[methodId]',
+    'client_order_number': 'clientOrderNumber',
+    'cross_image': 'cross_image',
+    'with_original': 'with_original',
+    'old_item_id': 'oldItemID',
+    'distributors_price_ups': 'distributorsPriceUps[{index}]',
+    'matrix_price_ups': 'matrixPriceUps[{index}]',
+}
+
+
+@lru_cache(maxsize=512)
 def get_excluded_keys(key: str):
-    excluded_keys = {
-        'order_positions': 'order[positions][_index_][_key_]',
-        'positions': 'positions[_index_][_key_]',
-        'articles_catalog': 'articles[_index_][_key_]',
-        'properties': 'properties[_key_][_index_]',
-        'order_params': 'orderParams[_key_]',
-        'distributors': 'distributors[_index_][_key_]',
-        'search': 'search[_index_][_key_]',
-        'basket_positions': 'positions[_index_][_key_]',
-        'goods_group': 'goods_group',
-        'note': 'order[notes][0][value]',
-        'del_note': 'order[notes][0][value]',
-        'delivery_address': 'delivery[meetData][address]',
-        'delivery_person': 'delivery[meetData][person]',
-        'delivery_contact': 'delivery[meetData][contact]',
-        'delivery_comment': 'delivery[meetData][comment]',
-        'delivery_employee_contact': 'delivery[meetData][employeeContact]',
-        'delivery_employee_person': 'delivery[meetData][employeePerson]',
-        'delivery_reseller_comment': 'delivery[meetData][resellerComment]',
-        'delivery_start_time': 'delivery[timeInterval][startTime]',
-        'delivery_end_time': 'delivery[timeInterval][endTime]',
-        'delivery_method_id': 'delivery[methodId]',
-        'client_order_number': 'clientOrderNumber',
-        'cross_image': 'cross_image',
-        'with_original': 'with_original',
-        'old_item_id': 'oldItemID',
-        'distributors_price_ups': 'distributorsPriceUps[_index_]',
-        'matrix_price_ups': 'matrixPriceUps[_index_]',
-    }
     try:
-        return excluded_keys[key]
+        return _EXCLUDED_KEYS[key]
     except KeyError:
         return get_pascal_case_key(key)
 
 
+def _add_list_as_is(data, key, value):
+    data[get_camel_case_key(key)] = value
+
+
+def _add_price_ups(data, key, value):
+    data.update(generate_price_ups(key, value))
+
+
+def _add_from_list(data, key, value):
+    data.update(generate_from_list(key, value))
+
+
+def _add_excluded_value(data, key, value):
+    data[get_excluded_keys(key)] = value
+
+
+def _add_sip(data, key, value):
+    data[key.upper()] = value
+    data[get_excluded_keys(key)] = value
+
+
+def _add_del_note(data, key, value):
+    data['order[notes][0][value]'] = ""
+    data['order[notes][0][id]'] = value
+
+
+_EXCLUDED_LIST_HANDLERS = {
+    'articles': _add_list_as_is,
+    'reseller_data': _add_list_as_is,
+    'distributors_price_ups': _add_price_ups,
+    'matrix_price_ups': _add_price_ups,
+}
+_EXCLUDED_VALUE_HANDLERS = {
+    'sip': _add_sip,
+    'del_note': _add_del_note,
+}
+
+
 def generate_payload(exclude=None, order: bool = False, **kwargs):
     """
     Generate payload
@@ -62,97 +111,93 @@ def generate_payload(exclude=None, order: bool = False, **kwargs):
     :param kwargs:
     :return: dict
     """
-    if exclude is None:
-        exclude = ['order_params', 'distributors', 'note', 'del_note',
-                   'basket_positions', 'sip']
+    exclude_set = _DEFAULT_EXCLUDE_SET if exclude is None else frozenset(exclude)
+    filter_set = exclude_set | _DEFAULT_FILTER_SET
     data = {}
 
     for key, value in kwargs.items():
-        if key not in exclude + DEFAULT_FILTER and value is not None and not key.startswith('_'):
+        if key not in filter_set and value is not None and key[:1] != '_':
             if not order:
-                if isinstance(value, list):
+                if type(value) is list:
                     for i, x in enumerate(value):
                         data[f"{get_camel_case_key(key)}[{i}]"] = x
                 else:
                     data[get_camel_case_key(key)] = value
             else:
                 data[f"order[{get_camel_case_key(key)}]"] = value
-        if key in exclude and key not in DEFAULT_FILTER and value is not None:
-            if isinstance(value, list):
-                if key == 'articles':
-                    data['articles'] = value
-                elif key == 'reseller_data':
-                    data['resellerData'] = value
-                elif key in ('distributors_price_ups', 'matrix_price_ups'):
-                    data = data | generate_price_ups(key, value)
-                else:
-                    data = {**data, **generate_from_list(key, value)}
-
+        elif key in exclude_set and key not in _DEFAULT_FILTER_SET and value is not None:
+            if type(value) is list:
+                _EXCLUDED_LIST_HANDLERS.get(key, _add_from_list)(data, key, value)
             else:
-                if key == 'sip':
-                    data[key.upper()] = value
-                if key == 'del_note':
-                    data['order[notes][0][value]'] = ""
-                    data['order[notes][0][id]'] = value
-                else:
-                    data[get_excluded_keys(key)] = value
-        if key == 'kwargs':
+                _EXCLUDED_VALUE_HANDLERS.get(key, _add_excluded_value)(data, key, value)
+        elif key == 'kwargs':
             for k, v, in value.items():
                 data[get_camel_case_key(k)] = v
-    logger.debug(f'{data}')
+    logger.debug('%s', data)
+    return data
+
+
+def generate_payload_scalar(**kwargs):
+    """
+    Generate payload for methods that take only scalar arguments
+    :param kwargs:
+    :return: dict
+    """
+    data = {get_camel_case_key(key): value for key, value in kwargs.items()
+            if value is not None and key not in _DEFAULT_FILTER_SET and key[:1] != '_'}
+    logger.debug('%s', data)
     return data
 
 
 def generate_price_ups(key, value):
     data = {}
+    template = get_excluded_keys(key)
     for i in range(len(value)):
         for key_z, value_z in value[i].items():
-            data_key = get_excluded_keys(key).replace('_index_', str(i)).replace('_key_', key_z)
+            data_key = template.format(index=i, key=key_z)
             if isinstance(value_z, dict):
-                list_keys = list(value_z.keys())
-                for key_j, value_j in value_z.items():
-                    index_key_j = list_keys.index(key_j)
+                for index_key_j, (key_j, value_j) in enumerate(value_z.items()):
                     data[f'{data_key}[{key_z}][{index_key_j}][name]'] = key_j
                     data[f'{data_key}[{key_z}][{index_key_j}][priceUp]'] = value_j
             else:
                 data[f'{data_key}[{key_z}]'] = value_z
-    logger.debug(f'{data}')
+    logger.debug('%s', data)
     return data
 
 
 def generate_from_list(key, value):
     data = {}
+    template = get_excluded_keys(key)
     for i in range(len(value)):
         for key_z, value_z in value[i].items():
-            if not isinstance(value_z, list):
-                data_key = get_excluded_keys(key).replace('_index_', str(i)).replace('_key_', key_z)
-                data[data_key] = value_z
-            else:
-                data_key = get_excluded_keys(key).replace('_index_', str(i)).replace('_key_', key_z)
+            data_key = template.format(index=i, key=key_z)
+            if type(value_z) is list:
                 for index_j, value_j in enumerate(value_z):
                     data[f'{data_key}[{index_j}]'] = value_j
-    logger.debug(f'{data}')
+            else:
+                data[data_key] = value_z
+    logger.debug('%s', data)
     return data
 
 
 def generate_payload_filter(**kwargs):
     data = {}
     for key, value in kwargs.items():
-        if key not in DEFAULT_FILTER and value is not None and not key.startswith('_'):
-            if isinstance(value, list):
+        if key not in _DEFAULT_FILTER_SET and value is not None and key[:1] != '_':
+            if type(value) is list:
                 for i, x in enumerate(value):
                     data[
                         f"filter[{get_camel_case_key(key)}][{i}]"] = x
             else:
                 data[f"filter[{get_camel_case_key(key)}]"] = value
-    logger.debug(f'{data}')
+    logger.debug('%s', data)
     return data
 
 
 def generate_payload_payments(single: bool = True, **kwargs):
     data = {}
     for key, value in kwargs.items():
-        if key not in DEFAULT_FILTER and value is not None and not key.startswith('_'):
+        if key not in _DEFAULT_FILTER_SET and value is not None and key[:1] != '_':
             if single:
                 if key == 'link_payments':
                     data['linkPayments'] = value
@@ -161,13 +206,13 @@ def generate_payload_payments(single: bool = True, **kwargs):
                         f"payments[0][{get_camel_case_key(key)}]"
                     ] = value
             else:
-                if isinstance(value, list):
+                if type(value) is list:
                     for z in range(len(value)):
                         for key_z, value_z in value[z].items():
                             data[f'payments[{z}][{key_z}]'] = value_z
                 else:
                     data[get_camel_case_key(key)] = value
-    logger.debug(f'{data}')
+    logger.debug('%s', data)
     return data
 
 
@@ -179,7 +224,7 @@ def generate_payload_online_order(**kwargs):
     """
     data = {}
     for key, value in kwargs.items():
-        if key not in DEFAULT_FILTER and value is not None and not key.startswith('_'):
+        if key not in _DEFAULT_FILTER_SET and value is not None and key[:1] != '_':
             if key == 'order_params':
                 for z in range(len(value)):
                     for key_z, value_z in value[0].items():
@@ -191,7 +236,7 @@ def generate_payload_online_order(**kwargs):
                             data[f'positions[{z}][{key_z}]'] = value_z
                         else:
                             data[f'positions[{z}][positionParams][{key_z}]'] = value_z
-    logger.debug(f'{data}')
+    logger.debug('%s', data)
     return data
 
 
@@ -201,24 +246,63 @@ def generate_file_payload(exclude=None, max_size: int = None, **kwargs):
     :param exclude:
     :param max_size: Максимальный размер в Мб
     :param kwargs:
-    :return: :obj:`aiohttp.FormData`
+    :return: :obj:`aiohttp.FormData` и список файлов, открытых по переданным путям.
+        Их нужно закрыть через close_files после запроса
     """
-    if exclude is None:
-        exclude = []
+    exclude_set = frozenset(exclude) if exclude else frozenset()
+    filter_set = exclude_set | _DEFAULT_FILTER_SET
+    paths = {key: value for key, value in kwargs.items()
+             if key in exclude_set and isinstance(value, str) and not value.isdigit()}
+    # Размеры проверяются до открытия первого файла, чтобы не оставлять открытых дескрипторов
+    if max_size is not None:
+        for value in paths.values():
+            if os.path.getsize(value) > max_size * 1_048_576:
+                raise FileSizeExceeded(f'Файл не может быть больше {max_size} Мб')
     data = FormData()
-    for key, value in kwargs.items():
-        if key not in exclude + DEFAULT_FILTER and value is not None and not key.startswith('_'):
-            data.add_field(get_camel_case_key(key), str(value))
-        if key in exclude and key != '' and value is not None:
-            if isinstance(value, BufferedReader):
-                data.add_field(get_camel_case_key(key), value, filename=value.name, content_type='multipart/form-data')
-            if isinstance(value, str) and not value.isdigit():
-                with open(value, 'rb') as file:
-                    if max_size is not None:
-                        size = file.seek(0, os.SEEK_END)
-                        if (size / 1_048_576) > max_size: raise FileSizeExceeded(
-                            f'Файл не может быть больше {max_size} Мб')
-                    data.add_field(get_camel_case_key(key), file, filename=file.name,
+    opened = []
+    try:
+        for key, value in kwargs.items():
+            if key not in filter_set and value is not None and key[:1] != '_':
+                data.add_field(get_camel_case_key(key), str(value))
+            elif key in exclude_set and key != '' and value is not None:
+                if isinstance(value, BufferedReader):
+                    data.add_field(get_camel_case_key(key), value, filename=value.name,
                                    content_type='multipart/form-data')
-    logger.debug(f'{data}')
-    return data
+                if key in paths:
+                    file = open(value, 'rb')
+                    opened.append(file)
+                    data.add_field(get_camel_case_key(key), file, filename=os.path.basename(value),
+                                   content_type='multipart/form-data')
+    except BaseException:
+        close_files(opened)
+        raise
+    logger.debug('%s', data)
+    return data, opened
+
+
+def close_files(files):
+    """
+    Закрывает файлы, открытые generate_file_payload
+    :param files: Список файлов
+    """
+    for file in files:
+        if not file.closed:
+            file.close()
+
+
+# Кратно 3 байтам, поэтому части base64 склеиваются без промежуточного выравнивания
+_BASE64_CHUNK_SIZE = 57 * 1024
+
+
+def encode_file_base64(path: str) -> str:
+    """
+    Кодирование файла в base64 частями: исходный файл не читается в память целиком,
+    но закодированная строка собирается в памяти полностью
+    :param path: Путь к файлу
+    :return: Содержимое файла строкой в формате base64
+    """
+    parts = []
+    with open(path, 'rb') as file:
+        for chunk in iter(partial(file.read, _BASE64_CHUNK_SIZE), b''):
+            parts.append(base64.b64encode(chunk).decode('ascii'))
+    return ''.join(parts)
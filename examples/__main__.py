@@ -0,0 +1,89 @@
+"""
+Запуск примеров одной командой: python -m examples <команда>
+
+Все команды работают через общую сессию из loader.py
+"""
+import argparse
+import datetime
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Примеры импортируют loader и config как модули верхнего уровня
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def search_brands(args):
+    from search_methods import search_brands
+    return search_brands()
+
+
+def search_articles(args):
+    from search_methods import search_articles
+    return search_articles()
+
+
+def search_batch(args):
+    from search_methods import search_bach
+    return search_bach()
+
+
+def search_history(args):
+    from search_methods import search_history
+    return search_history()
+
+
+def advices_batch(args):
+    from search_methods import advices_batch
+    return advices_batch()
+
+
+def basket_params(args):
+    from basket_params import get_basket_params
+    return get_basket_params()
+
+
+def orders(args):
+    from example import orders_list
+    date_end = datetime.datetime.now()
+    return orders_list(update_start=date_end - datetime.timedelta(days=args.days), update_end=date_end)
+
+
+def upload_price(args):
+    from upload_price import main
+    paths = [str(path.resolve()) for path in Path(args.directory).iterdir() if path.is_file()]
+    return main([args.distributor_id] * len(paths), paths)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='python -m examples', description='Примеры aioabcpapi')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('search-brands', help='Поиск брендов по номеру').set_defaults(handler=search_brands)
+    subparsers.add_parser('search-articles', help='Поиск по номеру и бренду').set_defaults(handler=search_articles)
+    subparsers.add_parser('search-batch', help='Пакетный поиск').set_defaults(handler=search_batch)
+    subparsers.add_parser('search-history', help='История поиска').set_defaults(handler=search_history)
+    subparsers.add_parser('advices-batch', help='Пакетное получение рекомендаций').set_defaults(handler=advices_batch)
+    subparsers.add_parser('basket-params', help='Параметры корзины').set_defaults(handler=basket_params)
+
+    orders_parser = subparsers.add_parser('orders', help='Список заказов за последние дни')
+    orders_parser.add_argument('--days', type=int, default=3)
+    orders_parser.set_defaults(handler=orders)
+
+    upload_parser = subparsers.add_parser('upload-price', help='Загрузка прайс-листов из каталога')
+    upload_parser.add_argument('distributor_id', type=int)
+    upload_parser.add_argument('--directory', default='files')
+    upload_parser.set_defaults(handler=upload_price)
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    args = parse_args()
+    # loader читает конфиг и создает клиент, поэтому импортируется только после разбора аргументов
+    from loader import run
+
+    run(args.handler(args))
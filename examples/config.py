@@ -1,20 +1,25 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 from environs import Env
 
 
-@dataclass
+@dataclass(frozen=True)
 class Abcp:
     host: str
     login: str
     password: str
+    login_user: str = None
+    password_user: str = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     abcp: Abcp
+    guest_id: int
 
 
+@lru_cache(maxsize=None)
 def load_config(path: str = None):
     env = Env()
     env.read_env(path)
@@ -22,5 +27,7 @@ def load_config(path: str = None):
     return Config(
         abcp=Abcp(
             host=env.str('ABCP_HOST'),
-            login=env.str('ABCP_LOGIN'), password=env.str('ABCP_PASSWORD')
-        ))
+            login=env.str('ABCP_LOGIN'), password=env.str('ABCP_PASSWORD'),
+            login_user=env.str('ABCP_LOGIN_USER', None), password_user=env.str('ABCP_PASSWORD_USER', None)
+        ),
+        guest_id=env.int('GUEST_ID'))
@@ -1,34 +1,30 @@
 import asyncio
+import logging
 import os
 
-from loader import api
-import logging
+from loader import api, run
 
-logging.basicConfig(level=logging.DEBUG)
-logging = logging.getLogger(__name__)
+logger = logging.getLogger(__name__)
 
 
 async def get_complaints():
     data = await api.ts.admin.customer_complaints.get(32)
-    logging.info(f'{data}')
+    logger.info('%s', data)
 
 
 async def update_complaint(path_to_file):
     # Данный метод поддерживает только передачу пути к файлу.
     # Он сам преобразует файл в base64
     data = await api.ts.admin.customer_complaints.update(32, 32, 25090387, custom_complaint_file=path_to_file)
-    logging.info(f"{data}")
+    logger.info('%s', data)
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
     cwd = os.getcwd()
     path_to_some_file = f'{cwd}/files/some_file.txt'
 
     # Необходимо только в Windows для избежания RuntimeError
     # asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-    loop = asyncio.new_event_loop()
-    try:
-        loop.run_until_complete(update_complaint(path_to_some_file))
-    finally:
-        loop.run_until_complete(api.close())
+    run(update_complaint(path_to_some_file))
@@ -1,6 +1,56 @@
+import asyncio
+import sys
+from functools import lru_cache
+
 from aioabcpapi import Abcp
-from examples.config import load_config
+from config import load_config
+
+try:
+    # uvloop необязателен, устанавливается из requirements.txt
+    from uvloop import new_event_loop
+except ImportError:
+    from asyncio import new_event_loop
 
 config = load_config()
+guest_id = config.guest_id
+
+
+@lru_cache(maxsize=None)
+def get_api() -> Abcp:
+    """Экземпляр API администратора, один на все примеры"""
+    return Abcp(config.abcp.host, config.abcp.login, config.abcp.password)
+
+
+@lru_cache(maxsize=None)
+def get_api_client() -> Abcp:
+    """Экземпляр API клиента, создается при первом вызове"""
+    return Abcp(config.abcp.host, config.abcp.login_user, config.abcp.password_user)
+
+
+api = get_api()
+
+
+async def close():
+    await get_api().close()
+    if get_api_client.cache_info().currsize:
+        await get_api_client().close()
+
 
-api = Abcp(config.abcp.host, config.abcp.login, config.abcp.password)
+def run(coro):
+    """
+    Запуск корутины примера и закрытие сессий в том же цикле событий
+    :param coro: Корутина примера
+    :return: Результат корутины
+    """
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            try:
+                return runner.run(coro)
+            finally:
+                runner.run(close())
+    loop = new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(close())
+        loop.close()
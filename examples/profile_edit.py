@@ -1,4 +1,4 @@
-from loader import api
+from loader import api, run
 import asyncio
 import logging
 
@@ -52,15 +52,11 @@ async def edit_profile():
 
                                                  })
 
-    logger.info(f'{data}')
+    logger.info('%s', data)
 
 
 if __name__ == '__main__':
     # Необходимо только в Windows для избежания RuntimeError
     # asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-    loop = asyncio.new_event_loop()
-    try:
-        loop.run_until_complete(edit_profile())
-    finally:
-        loop.run_until_complete(api.close())
\ No newline at end of file
+    run(edit_profile())
@@ -1,16 +1,14 @@
 import asyncio
 import logging
 
-from loader import api
+from loader import api, run
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 async def search_brands():
     data = await api.cp.client.search.brands(602000800)
     logger.info(data)
-    await api.close()
 
 
 async def search_articles():
@@ -20,7 +18,6 @@ async def search_articles():
                                                with_out_analogs=True
                                                )
     logger.info(data)
-    await api.close()
 
 
 async def search_bach():
@@ -30,7 +27,7 @@ async def search_bach():
 
 
 async def search_history():
-    logger.info(f'{await api.cp.client.search.history()}')
+    logger.info('%s', await api.cp.client.search.history())
 
 
 async def advices_batch():
@@ -40,11 +37,8 @@ async def advices_batch():
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
     # Необходимо только в Windows для избежания RuntimeError
     # asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-    loop = asyncio.new_event_loop()
-    try:
-        loop.run_until_complete(advices_batch())
-    finally:
-        loop.run_until_complete(api.close())
\ No newline at end of file
+    run(advices_batch())
@@ -1,27 +1,31 @@
 import asyncio
 import logging
+from pathlib import Path
 
-from loader import api
+from loader import api, run
 
 logger = logging.getLogger(__name__)
 
+# Ограничение одновременных загрузок, чтобы не упираться в лимит соединений сессии
+UPLOAD_LIMIT = 20
 
-async def example_upload_price_list(distributor_id, upload_file):
+
+async def example_upload_price_list(distributor_id, upload_file, semaphore):
     # В данном методе аргуемент upload_file может принимать как путь к файлу так и откытый файл.
-    # Открытый файл будет закрыт еще до отправки запроса к API
-    data = await api.cp.admin.distributors.pricelist_update(distributor_id=distributor_id, upload_file=upload_file)
+    # При передаче пути файл открывает библиотека, а aiohttp отправляет его частями и закрывает после отправки
+    async with semaphore:
+        data = await api.cp.admin.distributors.pricelist_update(distributor_id=distributor_id,
+                                                                upload_file=upload_file)
     logger.info(data)
 
 
-if __name__ == '__main__':
-    import os
+async def main(distributors, paths):
+    semaphore = asyncio.Semaphore(UPLOAD_LIMIT)
+    await asyncio.gather(*[example_upload_price_list(distributor_id, path, semaphore)
+                           for distributor_id, path in zip(distributors, paths)])
 
-    cwd = os.getcwd()
-    files = os.listdir('files')
-    distributors = [1642117]
-    for i in range(len(files)):
-        asyncio.run(example_upload_price_list(distributor_id=1642117,
-                                              upload_file=f'{cwd}/files/{files[i]}'))
-        # asyncio.run(example_upload_price_list(distributor_id=distributors[i],
-        #                                       upload_file=open(f'{cwd}/files/{files[i]}', 'rb')))
 
+if __name__ == '__main__':
+    paths = [str(path.resolve()) for path in Path('files').iterdir() if path.is_file()]
+    distributors = [1642117] * len(paths)
+    run(main(distributors, paths))